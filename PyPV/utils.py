@@ -1,8 +1,60 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property, partial
+
 import pandas as pd
 import numpy as np
-from scipy.interpolate import interp1d
-import matplotlib.pyplot as plt
-from scipy import stats
+
+# scipy.interpolate, matplotlib and numba are imported where they are used, so that
+# importing this module stays cheap for batch or headless use
+
+# Voltage units: factor to volts
+_V_SCALE = {'V': 1.0, 'mV': 1e-3}
+
+# Current units: (factor to mA, True if the unit is per cm² and must be multiplied by the area)
+_I_SCALE_MA = {
+    'A': (1000.0, False),
+    'mA': (1.0, False),
+    'A/cm2': (1000.0, True),
+    'mA/cm2': (1.0, True),
+}
+
+def _read_iv_columns(
+    filename, voltage_col_name, current_col_name, voltage_unit, current_unit, area, delimiter, decimal, dtype
+):
+    # Read the two columns and resolve the units: returns voltage in volts, the raw
+    # current column and its scale factor to mA (shared by read_and_process_data and
+    # analyze_file, which does not need the current density array)
+
+    # Resolve the unit scale factors (before reading, so bad units fail fast)
+    try:
+        v_scale = _V_SCALE[voltage_unit]
+    except KeyError:
+        raise ValueError("Unsupported voltage unit. Use 'V' or 'mV'.") from None
+    try:
+        c_scale_mA, per_area = _I_SCALE_MA[current_unit]
+    except KeyError:
+        raise ValueError("Unsupported current unit. Use 'A', 'mA', 'A/cm2', or 'mA/cm2'.") from None
+    if per_area:
+        if area is None:
+            raise ValueError("Area must be specified when using current density units.")
+        c_scale_mA *= float(area)  # Convert per-cm² units to mA
+
+    # Read the data
+    df = pd.read_csv(
+        filename,
+        delimiter=delimiter,
+        decimal=decimal,
+        usecols=[voltage_col_name, current_col_name],
+        dtype={voltage_col_name: dtype, current_col_name: dtype},
+        engine='c',
+    )
+
+    # Extract voltage and current columns
+    voltage = df[voltage_col_name].to_numpy(dtype=dtype, copy=False)
+    current = df[current_col_name].to_numpy(dtype=dtype, copy=False)
+
+    return voltage * v_scale, current, c_scale_mA
 
 def read_and_process_data(
     filename,
@@ -13,6 +65,7 @@ def read_and_process_data(
     area=None,
     delimiter=',',
     decimal='.',
+    dtype=np.float64,
 ):
     """
     Reads and processes IV data from a file.
@@ -26,51 +79,84 @@ def read_and_process_data(
     - area: float, area in cm^2 (required if current is per unit area)
     - delimiter: str, delimiter used in the file (default is ',')
     - decimal: str, decimal separator used in the file (default is '.')
+    - dtype: numpy dtype of the returned arrays (default is np.float64; np.float32 halves
+      memory use and is enough for typical source meter resolution)
 
     Returns:
-    - voltage: pandas Series, voltage data in volts
-    - current_mA: pandas Series, current data in mA
-    - current_density_mA_cm2: pandas Series, current density data in mA/cm^2 (if area is provided)
+    - voltage: numpy array, voltage data in volts
+    - current_mA: numpy array, current data in mA
+    - current_density_mA_cm2: numpy array, current density data in mA/cm^2 (if area is provided)
     """
-    # Read the data
-    df = pd.read_csv(filename, delimiter=delimiter, decimal=decimal)
-
-    # Extract voltage and current columns
-    voltage = df[voltage_col_name]
-    current = df[current_col_name]
-
-    # Convert voltage to volts if necessary
-    if voltage_unit == 'mV':
-        voltage = voltage / 1000  # Convert millivolts to volts
-    elif voltage_unit != 'V':
-        raise ValueError("Unsupported voltage unit. Use 'V' or 'mV'.")
-
-    # Process current units
-    if current_unit == 'A':
-        current_mA = current * 1000  # Convert amperes to milliamperes
-    elif current_unit == 'mA':
-        current_mA = current
-    elif current_unit == 'A/cm2':
-        if area is None:
-            raise ValueError("Area must be specified when using current density units.")
-        current_mA = current * area * 1000  # Convert A/cm² to mA
-    elif current_unit == 'mA/cm2':
-        if area is None:
-            raise ValueError("Area must be specified when using current density units.")
-        current_mA = current * area  # Convert mA/cm² to mA
-    else:
-        raise ValueError("Unsupported current unit. Use 'A', 'mA', 'A/cm2', or 'mA/cm2'.")
+    voltage, current, c_scale_mA = _read_iv_columns(
+        filename, voltage_col_name, current_col_name, voltage_unit, current_unit, area, delimiter, decimal, dtype
+    )
+    current_mA = current * c_scale_mA
 
     # Calculate current density if area is provided
     if area is not None:
-        current_density_mA_cm2 = current_mA / area  # mA/cm²
+        current_density_mA_cm2 = current * (c_scale_mA / float(area))  # mA/cm²
     else:
         current_density_mA_cm2 = None
 
     return voltage, current_mA, current_density_mA_cm2
 
 
-def interpolate_iv_curve(voltage, current, num_points=1500, kind='cubic', plot=False, label='Current (mA)'):
+@dataclass(eq=False, frozen=True)
+class IVCurve:
+    """
+    Interpolated IV curve returned by interpolate_iv_curve.
+
+    Columns can be read by name like a DataFrame (curve['Voltage (V)'], curve[label]),
+    and the curve unpacks as voltage, current = curve. The sorted samples used by
+    get_jsc and get_voc are prepared once per curve, so the curve is frozen (fields
+    cannot be reassigned) and the arrays should not be modified in place either.
+
+    Attributes:
+    - voltage: numpy array, voltage data in volts
+    - current: numpy array, current data (current or current density)
+    - label: str, label for the current data (e.g., 'Current (mA)', 'Current Density (mA/cm²)')
+    """
+    voltage: np.ndarray
+    current: np.ndarray
+    label: str = 'Current (mA)'
+
+    def __getitem__(self, col):
+        if col == 'Voltage (V)':
+            return self.voltage
+        if col == self.label:
+            return self.current
+        raise KeyError(col)
+
+    def __iter__(self):
+        return iter((self.voltage, self.current))
+
+    def __len__(self):
+        return len(self.voltage)
+
+    @cached_property
+    def _by_voltage(self):
+        # (voltage, current) sorted by ascending voltage, for np.interp
+        if (np.diff(self.voltage) >= 0).all():
+            return self.voltage, self.current
+        order = np.argsort(self.voltage)
+        return self.voltage[order], self.current[order]
+
+    @cached_property
+    def _by_current(self):
+        # (current, voltage) sorted by ascending current, for np.interp
+        order = np.argsort(self.current)
+        return self.current[order], self.voltage[order]
+
+    def to_frame(self):
+        """
+        Return the curve as a pandas DataFrame with 'Voltage (V)' and label columns.
+        """
+        return pd.DataFrame({'Voltage (V)': self.voltage, self.label: self.current})
+
+
+def interpolate_iv_curve(
+    voltage, current, num_points=1500, kind='cubic', plot=False, label='Current (mA)', dtype=np.float64
+):
     """
     Interpolate the IV curve using the specified interpolation method.
 
@@ -78,37 +164,57 @@ def interpolate_iv_curve(voltage, current, num_points=1500, kind='cubic', plot=F
     - voltage: array-like, voltage data in volts
     - current: array-like, current data (current or current density)
     - num_points: int, number of points to interpolate (default is 1500)
-    - kind: str, type of interpolation (default is 'cubic')
+    - kind: str, type of interpolation: 'linear', 'cubic' or 'pchip' (default is 'cubic')
     - plot: bool, if True, plot the raw and interpolated data
     - label: str, label for the current data (e.g., 'Current (mA)', 'Current Density (mA/cm²)')
+    - dtype: numpy dtype of the interpolated arrays (default is np.float64)
 
     Returns:
-    - interpolated_df: pandas DataFrame, containing interpolated voltage and current data
+    - interpolated_curve: IVCurve, containing interpolated voltage and current data
+      (use interpolated_curve.to_frame() to get a pandas DataFrame)
     """
-    # Ensure numpy arrays
-    voltage = np.array(voltage)
-    current = np.array(current)
-
-    # Sort the data by voltage
-    sorted_indices = np.argsort(voltage)
-    voltage_sorted = voltage[sorted_indices]
-    current_sorted = current[sorted_indices]
+    # Ensure numpy arrays (no copy for arrays from read_and_process_data)
+    voltage = np.asarray(voltage, dtype=dtype)
+    current = np.asarray(current, dtype=dtype)
+
+    # Sort the data by voltage (skipped when the sweep is already increasing)
+    if (np.diff(voltage) > 0).all():
+        voltage_unique = voltage
+        current_unique = current
+    else:
+        sorted_indices = np.argsort(voltage, kind='stable')
+        voltage_sorted = voltage[sorted_indices]
+        current_sorted = current[sorted_indices]
 
-    # Remove duplicate voltage values
-    voltage_unique, indices = np.unique(voltage_sorted, return_index=True)
-    current_unique = current_sorted[indices]
+        # Remove duplicate voltage values, keeping the first occurrence
+        keep = np.empty(voltage_sorted.shape, dtype=bool)
+        keep[0] = True
+        np.not_equal(voltage_sorted[1:], voltage_sorted[:-1], out=keep[1:])
+        voltage_unique = voltage_sorted[keep]
+        current_unique = current_sorted[keep]
 
     # Create interpolation function
-    interpolation_function = interp1d(voltage_unique, current_unique, kind=kind)
+    if kind == 'linear':
+        def interpolation_function(x):
+            return np.interp(x, voltage_unique, current_unique)
+    elif kind == 'cubic':
+        from scipy.interpolate import CubicSpline
+        interpolation_function = CubicSpline(voltage_unique, current_unique, extrapolate=False)
+    elif kind == 'pchip':
+        from scipy.interpolate import PchipInterpolator
+        interpolation_function = PchipInterpolator(voltage_unique, current_unique, extrapolate=False)
+    else:
+        raise ValueError("Unsupported interpolation kind. Use 'linear', 'cubic' or 'pchip'.")
 
     # Generate interpolated data
-    V = np.linspace(voltage_unique.min(), voltage_unique.max(), num_points)
-    I = interpolation_function(V)
+    V = np.linspace(voltage_unique.min(), voltage_unique.max(), num_points, dtype=dtype)
+    # np.interp and the scipy splines evaluate in float64
+    I = interpolation_function(V).astype(dtype, copy=False)
 
-    # Create DataFrame with interpolated data
-    interpolated_df = pd.DataFrame({'Voltage (V)': V, label: I})
+    interpolated_curve = IVCurve(V, I, label)
 
     if plot:
+        import matplotlib.pyplot as plt
         plt.plot(V, I, label='Interpolated Data')
         plt.plot(voltage, current, 'o', label='Raw Data')
         plt.xlabel('Voltage (V)')
@@ -117,18 +223,61 @@ def interpolate_iv_curve(voltage, current, num_points=1500, kind='cubic', plot=F
         plt.legend()
         plt.show()
 
-    return interpolated_df
+    return interpolated_curve
+
+def _sorted_samples(df, x_col, y_col):
+    # (x, y) arrays sorted ascending in x, as needed by np.searchsorted
+    if isinstance(df, IVCurve) and x_col == 'Voltage (V)' and y_col == df.label:
+        return df._by_voltage
+    if isinstance(df, IVCurve) and x_col == df.label and y_col == 'Voltage (V)':
+        return df._by_current
+    x = np.asarray(df[x_col], dtype=float)
+    y = np.asarray(df[y_col], dtype=float)
+    order = np.argsort(x)
+    return x[order], y[order]
 
 def _interpolate_at_x(df, x_col, y_col, x_target, kind='linear'):
-    x = df[x_col]
-    y = df[y_col]
-    interpolation_function = interp1d(x, y, kind=kind, fill_value="extrapolate")
-    return interpolation_function(x_target)
+    xs, ys = _sorted_samples(df, x_col, y_col)
+
+    if kind == 'cubic':
+        from scipy.interpolate import CubicSpline
+        xs, indices = np.unique(xs, return_index=True)
+        return CubicSpline(xs, ys[indices], extrapolate=True)(x_target)
+    elif kind != 'linear':
+        raise ValueError("Unsupported interpolation kind. Use 'linear' or 'cubic'.")
+
+    # Linear interpolation between the two samples bracketing x_target; clipping the
+    # bracket extrapolates from the end segments outside the data range
+    i = min(max(np.searchsorted(xs, x_target), 1), xs.size - 1)
+    x0, x1, y0, y1 = xs[i - 1], xs[i], ys[i - 1], ys[i]
+    return y0 + (x_target - x0) * (y1 - y0) / (x1 - x0)
+
+def _zero_crossing(x, y):
+    # x at the first sign change of y, by linear interpolation between the two
+    # bracketing samples; None if y does not change sign
+    if y.size == 0:
+        return None
+    s = np.signbit(y)
+    i = np.argmax(s != s[0])
+    if i == 0:
+        return None
+    x0, x1, y0, y1 = x[i - 1], x[i], y[i - 1], y[i]
+    return x0 - y0 * (x1 - x0) / (y1 - y0)
 
 def get_jsc(df, voltage_col='Voltage (V)', current_density_col='Current Density (mA/cm²)'):
     return _interpolate_at_x(df, voltage_col, current_density_col, 0)
 
 def get_voc(df, voltage_col='Voltage (V)', current_density_col='Current Density (mA/cm²)'):
+    V, J = _sorted_samples(df, voltage_col, current_density_col)
+
+    # First J = 0 crossing on the forward-bias part of the curve (V > 0). Only the two
+    # samples around it are used, so noise elsewhere on the curve does not matter.
+    i0 = np.searchsorted(V, 0, side='right')
+    voc = _zero_crossing(V[i0:], J[i0:])
+    if voc is not None:
+        return voc
+
+    # No zero crossing for V > 0 (e.g. Voc outside the measured range)
     return _interpolate_at_x(df, current_density_col, voltage_col, 0)
 
 def calculate_ff(df, jsc, voc, voltage_col='Voltage (V)', current_density_col='Current Density (mA/cm²)'):
@@ -136,7 +285,7 @@ def calculate_ff(df, jsc, voc, voltage_col='Voltage (V)', current_density_col='C
     Calcula o Fill Factor (FF) de uma célula solar.
 
     Parâmetros:
-    - df: pandas DataFrame contendo os dados interpolados da curva IV.
+    - df: IVCurve ou pandas DataFrame contendo os dados interpolados da curva IV.
     - jsc: float, densidade de corrente de curto-circuito (mA/cm²).
     - voc: float, tensão de circuito aberto (V).
     - voltage_col: str, nome da coluna de tensão.
@@ -145,20 +294,23 @@ def calculate_ff(df, jsc, voc, voltage_col='Voltage (V)', current_density_col='C
     Retorna:
     - ff: float, fator de preenchimento (unitário, entre 0 e 1).
     """
-    # Calcula a densidade de potência (P = V * J)
-    df['Power Density (mW/cm²)'] = df[voltage_col] * df[current_density_col]
-    
-    # Filtra o DataFrame para incluir apenas pontos onde V >= 0 e V <= Voc
-    filtered_df = df[(df[voltage_col] >= 0) & (df[voltage_col] <= voc)]
-    
-    # Verifica se o DataFrame filtrado está vazio
-    if filtered_df.empty:
+    V = np.asarray(df[voltage_col])
+    J = np.asarray(df[current_density_col])
+
+    # Índices dos pontos onde V >= 0 e V <= Voc
+    idx = np.flatnonzero((V >= 0) & (V <= voc))
+
+    # Verifica se há pontos no intervalo
+    if idx.size == 0:
         raise ValueError("Nenhum ponto de dados encontrado no intervalo V >= 0 e V <= Voc.")
-    
+
+    # Calcula a densidade de potência (P = V * J) apenas no intervalo, sem alterar df
+    P = V[idx] * J[idx]
+
     # Encontra o ponto de máxima potência (MPP) dentro do intervalo especificado
-    mpp_row = filtered_df.loc[filtered_df['Power Density (mW/cm²)'].idxmin()]
-    v_mp = mpp_row[voltage_col]            # Tensão no MPP
-    j_mp = mpp_row[current_density_col]    # Densidade de corrente no MPP
+    k = idx[np.argmin(P)]
+    v_mp = V[k]    # Tensão no MPP
+    j_mp = J[k]    # Densidade de corrente no MPP
 
     # Calcula o Fill Factor
     ff = (v_mp * j_mp) / (voc * jsc)
@@ -185,12 +337,18 @@ def calculate_pce(ff, voc, jsc, incident_power=100):
     pce = abs(p_out / incident_power) * 100  # Percentage
     return pce
 
+def _slope(x, y):
+    # Least-squares slope of y(x), the only linregress output the resistances need
+    # (the centred x sums to zero, so y needs no centring)
+    dx = x - x.mean()
+    return (dx @ y) / (dx @ dx)
+
 def calculate_resistances_from_iv(df, voltage_col='Voltage (V)', current_col='Current (mA)', low_voltage_limit=0.1, high_voltage_limit=0.9):
     """
     Calculate series resistance (Rs) and shunt resistance (Rsh) from IV data using linear regression.
 
     Parameters:
-    - df: pandas DataFrame, containing IV data
+    - df: IVCurve or pandas DataFrame, containing IV data
     - voltage_col: str, column name for voltage (default is 'Voltage (V)')
     - current_col: str, column name for current (default is 'Current (mA)')
     - low_voltage_limit: float, voltage threshold for low-voltage region for Rsh calculation (default is 0.1 V)
@@ -200,34 +358,357 @@ def calculate_resistances_from_iv(df, voltage_col='Voltage (V)', current_col='Cu
     - Rsh: float, shunt resistance (ohms)
     - Rs: float, series resistance (ohms)
     """
-    # Extract voltage and current data
-    voltage = df[voltage_col]
-    current_mA = df[current_col]
-
-    # Convert current from mA to A
-    current_A = current_mA / 1000  # Convert mA to A
+    # Extract voltage and current data as numpy arrays
+    V = np.asarray(df[voltage_col])
+    I_mA = np.asarray(df[current_col])
 
     # Shunt Resistance (Rsh) Calculation
-    low_voltage_mask = voltage < low_voltage_limit
-    if not any(low_voltage_mask):
+    low = V < low_voltage_limit
+    if not low.any():
         raise ValueError("No data points found for shunt resistance calculation in the specified voltage range.")
-    low_voltage_range = voltage[low_voltage_mask]
-    low_current_range_A = current_A[low_voltage_mask]
 
     # Linear regression for Rsh
-    slope_shunt, _, _, _, _ = stats.linregress(low_voltage_range, low_current_range_A)
+    slope_shunt = _slope(V[low], I_mA[low]) * 1e-3  # Convert mA/V to A/V
     Rsh = 1 / slope_shunt  # Shunt resistance
 
     # Series Resistance (Rs) Calculation
-    high_voltage_mask = voltage > high_voltage_limit
-    if not any(high_voltage_mask):
+    high = V > high_voltage_limit
+    if not high.any():
         raise ValueError("No data points found for series resistance calculation in the specified voltage range.")
-    high_voltage_range = voltage[high_voltage_mask]
-    high_current_range_A = current_A[high_voltage_mask]
 
     # Linear regression for Rs
-    slope_series, _, _, _, _ = stats.linregress(high_voltage_range, high_current_range_A)
+    slope_series = _slope(V[high], I_mA[high]) * 1e-3  # Convert mA/V to A/V
     Rs = 1 / slope_series  # Series resistance
 
     return Rs, Rsh
 
+
+
+def _iv_analyze_loop(V, J, I_mA, voc, v_lo, v_hi):
+    # Single pass over the curve: MPP search plus the least-squares sums for the
+    # low (Rsh) and high (Rs) voltage windows. x is shifted by the window limit
+    # to keep the sums well conditioned.
+    p_min = np.inf
+    v_mp = np.nan
+    j_mp = np.nan
+    mp_nan = False
+    n_mp = 0
+    n_lo = 0
+    sx_lo = 0.0
+    sy_lo = 0.0
+    sxx_lo = 0.0
+    sxy_lo = 0.0
+    n_hi = 0
+    sx_hi = 0.0
+    sy_hi = 0.0
+    sxx_hi = 0.0
+    sxy_hi = 0.0
+    for i in range(V.size):
+        v = V[i]
+        if v >= 0.0 and v <= voc:
+            # Same choice as np.argmin: the first minimum, or the first NaN if there is one
+            p = v * J[i]
+            if p != p:
+                if not mp_nan:
+                    mp_nan = True
+                    v_mp = v
+                    j_mp = J[i]
+            elif not mp_nan and (n_mp == 0 or p < p_min):
+                p_min = p
+                v_mp = v
+                j_mp = J[i]
+            n_mp += 1
+        if v < v_lo:
+            x = v - v_lo
+            n_lo += 1
+            sx_lo += x
+            sy_lo += I_mA[i]
+            sxx_lo += x * x
+            sxy_lo += x * I_mA[i]
+        if v > v_hi:
+            x = v - v_hi
+            n_hi += 1
+            sx_hi += x
+            sy_hi += I_mA[i]
+            sxx_hi += x * x
+            sxy_hi += x * I_mA[i]
+
+    slope_lo = np.nan
+    if n_lo > 1:
+        slope_lo = (n_lo * sxy_lo - sx_lo * sy_lo) / (n_lo * sxx_lo - sx_lo * sx_lo)
+    slope_hi = np.nan
+    if n_hi > 1:
+        slope_hi = (n_hi * sxy_hi - sx_hi * sy_hi) / (n_hi * sxx_hi - sx_hi * sx_hi)
+    return v_mp, j_mp, slope_lo, slope_hi, n_mp, n_lo, n_hi
+
+def _iv_analyze_numpy(V, J, I_mA, voc, v_lo, v_hi):
+    # Vectorized equivalent of _iv_analyze_loop, used when numba is not installed
+    idx = np.flatnonzero((V >= 0) & (V <= voc))
+    v_mp = j_mp = np.nan
+    if idx.size:
+        P = V[idx] * J[idx]
+        k = idx[np.argmin(P)]
+        v_mp, j_mp = V[k], J[k]
+    low = V < v_lo
+    high = V > v_hi
+    n_lo = np.count_nonzero(low)
+    n_hi = np.count_nonzero(high)
+    slope_lo = _slope(V[low], I_mA[low]) if n_lo > 1 else np.nan
+    slope_hi = _slope(V[high], I_mA[high]) if n_hi > 1 else np.nan
+    return v_mp, j_mp, slope_lo, slope_hi, idx.size, n_lo, n_hi
+
+_iv_analyze = None
+
+def _get_iv_analyze():
+    # Resolve the kernel on first use: numba-compiled when available, NumPy otherwise
+    global _iv_analyze
+    if _iv_analyze is None:
+        try:
+            from numba import njit
+        except ImportError:  # numba is optional
+            _iv_analyze = _iv_analyze_numpy
+        else:
+            _iv_analyze = njit(cache=True)(_iv_analyze_loop)
+    return _iv_analyze
+
+def calculate_ff_and_resistances(
+    density_df,
+    current_df,
+    jsc,
+    voc,
+    voltage_col='Voltage (V)',
+    current_density_col='Current Density (mA/cm²)',
+    current_col='Current (mA)',
+    low_voltage_limit=0.1,
+    high_voltage_limit=0.9,
+):
+    """
+    Calculate the fill factor (FF), series resistance (Rs) and shunt resistance (Rsh)
+    in a single pass over the interpolated IV data.
+
+    Gives the same results as calculate_ff and calculate_resistances_from_iv. The pass is
+    compiled with numba when it is installed, otherwise a NumPy implementation is used.
+
+    Parameters:
+    - density_df: IVCurve or pandas DataFrame, containing interpolated current density data
+    - current_df: IVCurve or pandas DataFrame, containing interpolated current data on the
+      same voltage points as density_df
+    - jsc: float, short-circuit current density (mA/cm²)
+    - voc: float, open-circuit voltage (V)
+    - voltage_col: str, column name for voltage (default is 'Voltage (V)')
+    - current_density_col: str, column name for current density (default is 'Current Density (mA/cm²)')
+    - current_col: str, column name for current (default is 'Current (mA)')
+    - low_voltage_limit: float, voltage threshold for low-voltage region for Rsh calculation (default is 0.1 V)
+    - high_voltage_limit: float, voltage threshold for high-voltage region for Rs calculation (default is 0.9 V)
+
+    Returns:
+    - ff: float, fill factor (unitless, between 0 and 1)
+    - Rs: float, series resistance (ohms)
+    - Rsh: float, shunt resistance (ohms)
+    """
+    V = np.asarray(density_df[voltage_col])
+    J = np.asarray(density_df[current_density_col])
+    I_mA = np.asarray(current_df[current_col])
+    if I_mA.shape != V.shape:
+        raise ValueError("Current and current density data must share the same voltage points.")
+
+    v_mp, j_mp, slope_lo, slope_hi, n_mp, n_lo, n_hi = _get_iv_analyze()(
+        V, J, I_mA, float(voc), float(low_voltage_limit), float(high_voltage_limit)
+    )
+    if n_mp == 0:
+        raise ValueError("No data points found in the range 0 <= V <= Voc.")
+    if n_lo == 0:
+        raise ValueError("No data points found for shunt resistance calculation in the specified voltage range.")
+    if n_hi == 0:
+        raise ValueError("No data points found for series resistance calculation in the specified voltage range.")
+
+    ff = abs((v_mp * j_mp) / (voc * jsc))
+    # Slopes are in mA/V, convert to A/V
+    Rs = 1 / (slope_hi * 1e-3)
+    Rsh = 1 / (slope_lo * 1e-3)
+    return ff, Rs, Rsh
+
+def _batch_masked_slope(x, y, mask):
+    # Row-wise least-squares slope of y(x) over the points selected by mask
+    # (the centred x sums to zero over the mask, so y needs no centring)
+    xm = np.einsum('kn,kn->k', x, mask) / mask.sum(axis=1)
+    dx = x - xm[:, None]
+    dx[~mask] = 0.0
+    return np.einsum('kn,kn->k', dx, y) / np.einsum('kn,kn->k', dx, dx)
+
+def analyze_iv_batch(
+    voltages,
+    currents_mA,
+    area,
+    num_points=1500,
+    kind='cubic',
+    low_voltage_limit=0.1,
+    high_voltage_limit=None,
+    incident_power=100,
+    dtype=np.float64,
+):
+    """
+    Analyze several IV curves at once.
+
+    Each curve is interpolated onto num_points voltage points and the results are stacked
+    into 2D arrays, so Jsc, Voc, FF, PCE, Rs and Rsh are computed with one vectorized
+    reduction per parameter instead of one Python call per curve.
+
+    Parameters:
+    - voltages: sequence of array-like, voltage data in volts for each curve
+    - currents_mA: sequence of array-like, current data in mA for each curve
+    - area: float or array-like, cell area in cm^2 (one value for all curves or one per curve)
+    - num_points: int, number of points to interpolate (default is 1500)
+    - kind: str, type of interpolation: 'linear', 'cubic' or 'pchip' (default is 'cubic')
+    - low_voltage_limit: float, voltage threshold for low-voltage region for Rsh calculation (default is 0.1 V)
+    - high_voltage_limit: float or array-like, voltage threshold for high-voltage region for Rs
+      calculation (default is 0.9 * Voc of each curve)
+    - incident_power: float, the incident light power in mW/cm² (default is 100 mW/cm²)
+    - dtype: numpy dtype of the interpolated curves (default is np.float64)
+
+    Returns:
+    - results: dict of numpy arrays with one entry per curve, with keys
+      'jsc' (mA/cm²), 'voc' (V), 'ff', 'pce' (%), 'Rs' (ohms) and 'Rsh' (ohms)
+    """
+    if len(voltages) != len(currents_mA):
+        raise ValueError("voltages and currents_mA must contain the same number of curves.")
+
+    # Interpolate every curve onto its own num_points grid and stack them, shape (K, N)
+    curves = [
+        interpolate_iv_curve(voltage, current, num_points=num_points, kind=kind, dtype=dtype)
+        for voltage, current in zip(voltages, currents_mA)
+    ]
+    V = np.stack([curve.voltage for curve in curves])
+    I_mA = np.stack([curve.current for curve in curves])
+    J = I_mA / np.reshape(np.asarray(area, dtype=dtype), (-1, 1))
+    rows = np.arange(V.shape[0])
+
+    # Jsc: linear interpolation at V = 0 between the bracketing grid points (each row of V
+    # is increasing); clipping the bracket extrapolates from the end segments
+    i1 = np.clip((V < 0).sum(axis=1), 1, V.shape[1] - 1)
+    i0 = i1 - 1
+    v0, v1 = V[rows, i0], V[rows, i1]
+    jsc = J[rows, i0] + (0 - v0) * (J[rows, i1] - J[rows, i0]) / (v1 - v0)
+
+    # Voc: first J = 0 crossing on the forward-bias branch, as in get_voc
+    forward = V > 0
+    i_fwd = np.argmax(forward, axis=1)
+    orientation = np.where(J[:, -1] < J[rows, i_fwd], -1.0, 1.0)
+    crossing = forward & (J * orientation[:, None] >= 0)
+    c = np.argmax(crossing, axis=1)
+    found = crossing[rows, c] & (c > 0)
+    c = np.maximum(c, 1)
+    found &= forward[rows, c - 1]
+    j0, j1 = J[rows, c - 1], J[rows, c]
+    voc = V[rows, c - 1] + (0 - j0) * (V[rows, c] - V[rows, c - 1]) / (j1 - j0)
+    for k in np.flatnonzero(~found):
+        voc[k] = get_voc(IVCurve(V[k], J[k], 'Current Density (mA/cm²)'))
+
+    # FF: maximum power point inside 0 <= V <= Voc
+    window = (V >= 0) & (V <= voc[:, None])
+    if not window.any(axis=1).all():
+        raise ValueError("No data points found in the range 0 <= V <= Voc for some curves.")
+    P = V * J
+    P[~window] = np.inf
+    k_mp = np.argmin(P, axis=1)
+    ff = np.abs((V[rows, k_mp] * J[rows, k_mp]) / (voc * jsc))
+    pce = calculate_pce(ff, voc, jsc, incident_power=incident_power)
+
+    # Rs and Rsh from the slopes of the high- and low-voltage windows
+    if high_voltage_limit is None:
+        high_voltage_limit = 0.9 * voc
+    low = V < low_voltage_limit
+    high = V > np.reshape(np.asarray(high_voltage_limit, dtype=dtype), (-1, 1))
+    if not low.any(axis=1).all():
+        raise ValueError("No data points found for shunt resistance calculation in the specified voltage range.")
+    if not high.any(axis=1).all():
+        raise ValueError("No data points found for series resistance calculation in the specified voltage range.")
+    # Slopes are in mA/V, convert to A/V
+    Rsh = 1 / (_batch_masked_slope(V, I_mA, low) * 1e-3)
+    Rs = 1 / (_batch_masked_slope(V, I_mA, high) * 1e-3)
+
+    return {'jsc': jsc, 'voc': voc, 'ff': ff, 'pce': pce, 'Rs': Rs, 'Rsh': Rsh}
+
+def analyze_file(
+    filename,
+    voltage_col_name,
+    current_col_name,
+    area,
+    voltage_unit='V',
+    current_unit='mA',
+    delimiter=',',
+    decimal='.',
+    num_points=1500,
+    kind='cubic',
+    low_voltage_limit=0.1,
+    high_voltage_limit=None,
+    incident_power=100,
+    dtype=np.float64,
+):
+    """
+    Read one IV data file and calculate all solar cell parameters.
+
+    Parameters:
+    - filename: str, path to the data file
+    - voltage_col_name, current_col_name, voltage_unit, current_unit, delimiter, decimal:
+      as in read_and_process_data
+    - area: float, area in cm^2
+    - num_points, kind, dtype: as in interpolate_iv_curve
+    - low_voltage_limit: float, voltage threshold for low-voltage region for Rsh calculation (default is 0.1 V)
+    - high_voltage_limit: float, voltage threshold for high-voltage region for Rs calculation
+      (default is 0.9 * Voc)
+    - incident_power: float, the incident light power in mW/cm² (default is 100 mW/cm²)
+
+    Returns:
+    - results: dict with keys 'filename', 'jsc' (mA/cm²), 'voc' (V), 'ff', 'pce' (%),
+      'Rs' (ohms) and 'Rsh' (ohms)
+    """
+    # Only the current in mA is needed: the density curve is derived from its interpolation
+    voltage, current, c_scale_mA = _read_iv_columns(
+        filename, voltage_col_name, current_col_name, voltage_unit, current_unit, area, delimiter, decimal, dtype
+    )
+    current_mA = current * c_scale_mA
+    current_curve = interpolate_iv_curve(
+        voltage, current_mA, num_points=num_points, kind=kind, label='Current (mA)', dtype=dtype
+    )
+    # The interpolation is linear in the data, so the density curve is the current curve scaled by 1/area
+    density_curve = IVCurve(current_curve.voltage, current_curve.current / area, 'Current Density (mA/cm²)')
+
+    jsc = get_jsc(density_curve)
+    voc = get_voc(density_curve)
+    if high_voltage_limit is None:
+        high_voltage_limit = 0.9 * voc
+    ff, Rs, Rsh = calculate_ff_and_resistances(
+        density_curve,
+        current_curve,
+        jsc,
+        voc,
+        low_voltage_limit=low_voltage_limit,
+        high_voltage_limit=high_voltage_limit,
+    )
+    pce = calculate_pce(ff, voc, jsc, incident_power=incident_power)
+    return {'filename': filename, 'jsc': jsc, 'voc': voc, 'ff': ff, 'pce': pce, 'Rs': Rs, 'Rsh': Rsh}
+
+def _analyze_one(args, kwargs, filename):
+    # Module-level so it can be pickled for the worker processes
+    return analyze_file(filename, *args, **kwargs)
+
+def analyze_many(filenames, *args, max_workers=None, **kwargs):
+    """
+    Run analyze_file on several files in parallel worker processes.
+
+    Files are independent, so each one is read, interpolated and analyzed in its own
+    process. On Windows and macOS the calling script must be protected by
+    if __name__ == '__main__':.
+
+    Parameters:
+    - filenames: sequence of str, paths to the data files
+    - *args, **kwargs: passed to analyze_file for every file
+    - max_workers: int, number of worker processes (default is the number of CPUs)
+
+    Returns:
+    - results: list of dicts returned by analyze_file, in the order of filenames
+    """
+    analyze_one = partial(_analyze_one, args, kwargs)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(analyze_one, filenames))
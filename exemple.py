@@ -1,5 +1,7 @@
 import os
+import matplotlib.pyplot as plt
 from PyPV.utils import (
+    IVCurve,
     read_and_process_data,
     interpolate_iv_curve,
     get_jsc,
@@ -37,8 +39,21 @@ voltage, current_mA, current_density_mA_cm2 = read_and_process_data(
 # Interpole os dados de corrente para Rs e Rsh
 interpolated_current = interpolate_iv_curve(voltage, current_mA, label='Current (mA)', plot=False)
 
-# Interpole os dados de densidade de corrente para Jsc, Voc, FF e PCE
-interpolated_current_density = interpolate_iv_curve(voltage, current_density_mA_cm2, label='Current Density (mA/cm²)', plot=True)
+# Densidade de corrente para Jsc, Voc, FF e PCE: a mesma curva interpolada dividida pela área
+interpolated_current_density = IVCurve(
+    interpolated_current.voltage,
+    interpolated_current.current / area,
+    'Current Density (mA/cm²)',
+)
+
+# Plote a curva de densidade de corrente interpolada junto com os dados medidos
+plt.plot(interpolated_current_density.voltage, interpolated_current_density.current, label='Interpolated Data')
+plt.plot(voltage, current_density_mA_cm2, 'o', label='Raw Data')
+plt.xlabel('Voltage (V)')
+plt.ylabel('Current Density (mA/cm²)')
+plt.title('IV Curve and Interpolation')
+plt.legend()
+plt.show()
 
 # Calcule Jsc e Voc
 jsc = get_jsc(interpolated_current_density)
@@ -10,6 +10,9 @@ setup(
         'scipy',
         'matplotlib',
     ],
+    extras_require={
+        'numba': ['numba'],
+    },
     author='Kaike Pacheco',
     author_email='fisikaike@live.com',
     description='Biblioteca para análise de curvas IV de células solares',
@@ -19,5 +22,5 @@ setup(
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.8',
 )